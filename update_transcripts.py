@@ -3,37 +3,126 @@
 Fetch transcripts for a playlist and emit static JSON files + index.json for CDN hosting (e.g., GitHub Pages).
 
 - Generates EN original + KO translated in one pass
+  (KO via YouTube auto-translate, or batch MT with MT_PROVIDER=deepl|google)
 - Splits into sentence-level segments (handles multiple sentences in one subtitle line)
 - Saves to /transcripts/en/{videoId}.json and /transcripts/ko/{videoId}.json
 """
 from __future__ import annotations
 
+import argparse
+import functools
+import hashlib
 import json
 import os
 import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from importlib import metadata
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from youtube_transcript_api import (
+    FetchedTranscriptSnippet,
     NoTranscriptFound,
     TranscriptsDisabled,
     VideoUnavailable,
     YouTubeTranscriptApi,
 )
 
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib encoder
+    orjson = None
+
 BASE_DIR = Path(__file__).resolve().parent
 TRANSCRIPTS_DIR = BASE_DIR / "transcripts"
 INDEX_PATH = BASE_DIR / "index.json"
+CACHE_DIR = BASE_DIR / ".cache"
+PLAYLIST_CACHE_PATH = CACHE_DIR / "playlist.json"
+RAW_CACHE_DIR = CACHE_DIR / "raw"
+HASH_CACHE_DIR = CACHE_DIR / "hash"
+PROVIDER_CACHE_DIR = CACHE_DIR / "provider"
 PLAYLIST_ITEMS_URL = "https://www.googleapis.com/youtube/v3/playlistItems"
+DEEPL_API_URL = "https://api.deepl.com/v2/translate"
+DEEPL_FREE_API_URL = "https://api-free.deepl.com/v2/translate"
+GOOGLE_TRANSLATE_URL = "https://translation.googleapis.com/language/translate/v2"
+MT_PROVIDERS = {"youtube": None, "deepl": "DEEPL_API_KEY", "google": "GOOGLE_TRANSLATE_API_KEY"}
+MT_BATCH_SIZE = 50  # texts per MT request (DeepL's per-request limit)
+EN_LANGUAGES = ["en", "en-US", "en-GB"]
+MAX_WORKERS = 16  # concurrent transcript fetches; lower this if YouTube starts returning 429s
+
+# Read once at import: os.umask() can only be queried by setting it, which is not thread-safe.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
 
 ytt_api = YouTubeTranscriptApi()
 
+# Shared keep-alive session for YouTube Data API calls, retrying transient 5xx responses.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504)),
+    ),
+)
+try:
+    TRANSCRIPT_API_VERSION = metadata.version("youtube-transcript-api")
+except metadata.PackageNotFoundError:
+    TRANSCRIPT_API_VERSION = "unknown"
+
 # Sentence helpers
-_SENTENCE_END_RE = re.compile(r"[.!?？！。…]+$")
+_SENTENCE_ENDINGS = (".", "!", "?", "？", "！", "。", "…")
+_SENTENCE_TERMINATORS = frozenset(_SENTENCE_ENDINGS)
 _SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?？！。…])\s+")
-_START_LEAD_IN = 1.0  # seconds to pull start times earlier when a sentence begins mid-segment
+_START_LEAD_IN_MS = 1000  # ms to pull start times earlier when a sentence begins mid-segment
+
+
+def dump_json(data: object, indent: bool = True) -> bytes:
+    """
+    Serialize to UTF-8 JSON (non-ASCII kept as-is), using orjson when available.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE if indent else 0
+        return orjson.dumps(data, option=option)
+    if indent:
+        return (json.dumps(data, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def load_json(path: Path) -> object:
+    """
+    Parse a JSON file from raw bytes, using orjson when available.
+
+    Decode errors surface as ValueError with either backend.
+    """
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write via a temp file in the same directory + os.replace, so readers never see a partial file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    )
+    try:
+        with tmp:
+            tmp.write(data)
+        os.chmod(tmp.name, 0o666 & ~_UMASK)  # NamedTemporaryFile creates 0600 files
+        os.replace(tmp.name, path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
 
 
 def load_env() -> dict:
@@ -50,17 +139,61 @@ def load_env() -> dict:
         ]
         if not value
     ]
+    mt_provider = (os.getenv("MT_PROVIDER") or "youtube").lower()
+    if mt_provider not in MT_PROVIDERS:
+        raise SystemExit(
+            f"Unknown MT_PROVIDER {mt_provider!r} (expected one of: {', '.join(MT_PROVIDERS)})"
+        )
+    mt_key_name = MT_PROVIDERS[mt_provider]
+    mt_api_key = os.getenv(mt_key_name) if mt_key_name else None
+    if mt_key_name and not mt_api_key:
+        missing.append(mt_key_name)
     if missing:
         raise SystemExit(f"Missing required env vars: {', '.join(missing)}")
     return {
         "api_key": api_key,
         "playlist_id": playlist_id,
         "base_url": base_url.rstrip("/"),
+        "mt_provider": mt_provider,
+        "mt_api_key": mt_api_key,
     }
 
 
-def fetch_playlist_video_ids(api_key: str, playlist_id: str) -> List[str]:
-    ids: List[str] = []
+def load_playlist_cache(playlist_id: str) -> Dict[str, dict]:
+    """
+    Return cached playlist pages keyed by page token ("" for the first page).
+    """
+    if not PLAYLIST_CACHE_PATH.exists():
+        return {}
+    try:
+        data = load_json(PLAYLIST_CACHE_PATH)
+    except (OSError, ValueError) as exc:
+        print(f"[warn] ignoring unreadable playlist cache: {exc}")
+        return {}
+    if not isinstance(data, dict) or data.get("playlistId") != playlist_id:
+        return {}
+    pages = data.get("pages")
+    if not isinstance(pages, dict):
+        return {}
+    return {
+        token: page
+        for token, page in pages.items()
+        if isinstance(page, dict) and page.get("etag") and isinstance(page.get("videoIds"), list)
+    }
+
+
+def save_playlist_cache(playlist_id: str, pages: Dict[str, dict]) -> None:
+    write_atomic(PLAYLIST_CACHE_PATH, dump_json({"playlistId": playlist_id, "pages": pages}))
+
+
+def iter_playlist_video_ids(api_key: str, playlist_id: str) -> Iterator[str]:
+    """
+    Yield playlist video IDs page by page so callers can start work before pagination ends.
+
+    Each page's ETag is cached; unchanged pages come back as 304 and are served from the cache.
+    """
+    cached_pages = load_playlist_cache(playlist_id)
+    pages: Dict[str, dict] = {}
     page_token: Optional[str] = None
     while True:
         params = {
@@ -71,38 +204,87 @@ def fetch_playlist_video_ids(api_key: str, playlist_id: str) -> List[str]:
         }
         if page_token:
             params["pageToken"] = page_token
-        resp = requests.get(PLAYLIST_ITEMS_URL, params=params, timeout=15)
-        resp.raise_for_status()
-        data = resp.json()
-        for item in data.get("items", []):
-            video_id = item.get("contentDetails", {}).get("videoId")
-            if video_id:
-                ids.append(video_id)
-        page_token = data.get("nextPageToken")
+        cache_key = page_token or ""
+        cached = cached_pages.get(cache_key)
+        headers = {"If-None-Match": cached["etag"]} if cached else {}
+        resp = _SESSION.get(PLAYLIST_ITEMS_URL, params=params, headers=headers, timeout=15)
+        if cached and resp.status_code == 304:
+            page = cached
+        else:
+            resp.raise_for_status()
+            data = resp.json()
+            video_ids: List[str] = []
+            for item in data.get("items", []):
+                video_id = item.get("contentDetails", {}).get("videoId")
+                if video_id:
+                    video_ids.append(video_id)
+            page = {
+                "etag": resp.headers.get("ETag") or data.get("etag"),
+                "videoIds": video_ids,
+                "nextPageToken": data.get("nextPageToken"),
+            }
+        if page.get("etag"):
+            pages[cache_key] = page
+        yield from page["videoIds"]
+        page_token = page.get("nextPageToken")
         if not page_token:
             break
-    return ids
+    save_playlist_cache(playlist_id, pages)
 
 
-def merge_segments_to_sentences(segments: List[dict], max_chars: int = 240) -> List[dict]:
+def _split_sentences(text: str) -> Tuple[Tuple[str, ...], int]:
+    """
+    Split stripped text after sentence-ending punctuation followed by whitespace.
+
+    Returns the sentences and their combined length.
     """
-    Convert raw transcript segments into sentence-level segments.
+    # Fast path: a split needs a terminator before the last character.
+    head = text[:-1]
+    for ch in _SENTENCE_ENDINGS:
+        if ch in head:
+            return _regex_split_sentences(text)
+    return (text,), len(text)
+
+
+@functools.lru_cache(maxsize=4096)
+def _regex_split_sentences(text: str) -> Tuple[Tuple[str, ...], int]:
+    # Memoized because intro/outro lines repeat across a playlist's videos. The input is
+    # stripped and the split consumes whole whitespace runs, so parts need no further strip.
+    sentences = tuple(_SENTENCE_SPLIT_RE.split(text))
+    return sentences, sum(map(len, sentences))
+
+
+def merge_segments_to_sentences(
+    segments: Iterable[FetchedTranscriptSnippet], max_chars: int = 240
+) -> List[dict]:
+    """
+    Convert transcript snippets (e.g. a FetchedTranscript) into sentence-level segments.
 
     - Splits a single subtitle line into sentences when multiple exist.
     - Distributes duration proportionally by sentence length.
     - Merges buffered text until sentence-ending punctuation or max_chars threshold.
     - Skips noise like [music]/(music)
+
+    Timing is tracked in integer milliseconds and only converted back to seconds for output.
     """
     merged: List[dict] = []
 
-    buffer_texts: List[str] = []
-    buffer_start: Optional[float] = None
-    buffer_segment_start: Optional[float] = None
+    buffer: List[str] = []
+    buffer_start: Optional[int] = None
+    buffer_segment_start: Optional[int] = None
     buffer_text_len = 0
-    last_end: Optional[float] = None
+    last_end: Optional[int] = None
+
+    # Local aliases keep attribute/global lookups out of the per-segment loop.
+    append = merged.append
+    split_sentences = _split_sentences
+    terminators = _SENTENCE_TERMINATORS
 
     for seg in segments:
-        raw_text = (seg.get("text") or "").strip()
+        raw_text = seg.text
+        if not raw_text:
+            continue
+        raw_text = raw_text.strip()
         if not raw_text:
             continue
         # 필터: [music], (music) 등 노이즈 제거
@@ -110,43 +292,36 @@ def merge_segments_to_sentences(segments: List[dict], max_chars: int = 240) -> L
         if "[music]" in lowered or "(music)" in lowered or lowered == "music":
             continue
 
-        start = float(seg.get("start", 0.0))
-        duration = float(seg.get("duration", 0.0))
+        start = int(seg.start * 1000 + 0.5)
+        duration = int(seg.duration * 1000 + 0.5)
         end = start + duration
 
-        sentences = [s.strip() for s in _SENTENCE_SPLIT_RE.split(raw_text) if s.strip()]
-        if not sentences:
-            continue
-
-        total_len = sum(len(s) for s in sentences) or len(sentences)
-        sentence_starts: List[float] = []
-        sentence_durations: List[float] = []
-        cursor = start
-        for idx, s in enumerate(sentences):
-            if idx == len(sentences) - 1:
-                seg_duration = end - cursor
+        sentences, total_len = split_sentences(raw_text)
+        last_idx = len(sentences) - 1
+        s_start = start
+        cum_len = 0
+        for idx, s_text in enumerate(sentences):
+            # Distribute the segment's duration by cumulative sentence length. The last (and
+            # usually only) sentence ends at the segment end, so it skips the arithmetic.
+            if idx == last_idx:
+                s_end = end
             else:
-                ratio = len(s) / total_len
-                seg_duration = duration * ratio
-            sentence_starts.append(cursor)
-            sentence_durations.append(seg_duration)
-            cursor += seg_duration
-
-        for s_text, s_start, s_dur in zip(sentences, sentence_starts, sentence_durations):
-            s_end = s_start + s_dur
-            if not buffer_texts:
+                cum_len += len(s_text)
+                s_end = start + duration * cum_len // total_len
+            if not buffer:
                 buffer_start = s_start
                 buffer_segment_start = start
 
-            buffer_texts.append(s_text)
+            buffer.append(s_text)
             buffer_text_len += len(s_text) + 1
             last_end = s_end
 
-            is_sentence_end = bool(_SENTENCE_END_RE.search(s_text))
+            # Every sentence but the last was split at a terminator, so only the last needs a check.
+            is_sentence_end = idx < last_idx or s_text[-1] in terminators
             is_too_long = buffer_text_len >= max_chars
 
             if is_sentence_end or is_too_long:
-                merged_text = " ".join(buffer_texts).strip()
+                merged_text = " ".join(buffer)
                 if buffer_start is None or last_end is None:
                     buffer_start = s_start
                     last_end = s_end
@@ -154,47 +329,165 @@ def merge_segments_to_sentences(segments: List[dict], max_chars: int = 240) -> L
                 # If a sentence starts mid-segment, pull the timestamp slightly earlier
                 # (but never before the original segment's start) so the opening words
                 # are not clipped when seeking.
-                lead_in = 0.0
+                lead_in = 0
                 if buffer_segment_start is not None:
-                    lead_in = min(_START_LEAD_IN, max(0.0, buffer_start - buffer_segment_start))
-                start_with_lead = max(0.0, buffer_start - lead_in)
+                    lead_in = min(_START_LEAD_IN_MS, max(0, buffer_start - buffer_segment_start))
+                start_with_lead = max(0, buffer_start - lead_in)
 
-                merged.append(
+                append(
                     {
                         "text": merged_text,
-                        "start": start_with_lead,
-                        "duration": round(last_end - start_with_lead, 3),
+                        "start": start_with_lead / 1000,
+                        "duration": (last_end - start_with_lead) / 1000,
                     }
                 )
-                buffer_texts = []
+                buffer.clear()
                 buffer_start = None
                 buffer_segment_start = None
                 buffer_text_len = 0
                 last_end = None
 
-    if buffer_texts and buffer_start is not None and last_end is not None:
-        merged_text = " ".join(buffer_texts).strip()
-        lead_in = 0.0
+            s_start = s_end
+
+    if buffer and buffer_start is not None and last_end is not None:
+        merged_text = " ".join(buffer)
+        lead_in = 0
         if buffer_segment_start is not None:
-            lead_in = min(_START_LEAD_IN, max(0.0, buffer_start - buffer_segment_start))
-        start_with_lead = max(0.0, buffer_start - lead_in)
+            lead_in = min(_START_LEAD_IN_MS, max(0, buffer_start - buffer_segment_start))
+        start_with_lead = max(0, buffer_start - lead_in)
         merged.append(
             {
                 "text": merged_text,
-                "start": start_with_lead,
-                "duration": round(last_end - start_with_lead, 3),
+                "start": start_with_lead / 1000,
+                "duration": (last_end - start_with_lead) / 1000,
             }
         )
 
     return merged
 
 
-def fetch_transcripts_en_ko(video_id: str) -> Optional[Dict[str, Optional[List[dict]]]]:
+def load_raw_cache(video_id: str, lang: str, provider: str = "youtube") -> Optional[List[dict]]:
+    """
+    Return cached transcript segments, or None on a miss, a youtube-transcript-api upgrade,
+    or segments produced by a different provider (YouTube vs. a batch MT API for KO).
+    """
+    path = RAW_CACHE_DIR / f"{video_id}.{lang}.json"
+    if not path.exists():
+        return None
+    try:
+        data = load_json(path)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("transcriptApiVersion") != TRANSCRIPT_API_VERSION:
+        return None
+    if data.get("provider", "youtube") != provider:
+        return None
+    segments = data.get("segments")
+    return segments if isinstance(segments, list) else None
+
+
+def save_raw_cache(
+    video_id: str, segments: List[dict], lang: str, provider: str = "youtube"
+) -> None:
+    write_atomic(
+        RAW_CACHE_DIR / f"{video_id}.{lang}.json",
+        dump_json(
+            {
+                "transcriptApiVersion": TRANSCRIPT_API_VERSION,
+                "provider": provider,
+                "segments": segments,
+            },
+            indent=False,
+        ),
+    )
+
+
+def to_snippets(segments: List[dict]) -> List[FetchedTranscriptSnippet]:
+    return [FetchedTranscriptSnippet(**seg) for seg in segments]
+
+
+def hash_segments(segments: List[dict]) -> str:
+    return hashlib.blake2b(dump_json(segments, indent=False), digest_size=16).hexdigest()
+
+
+def load_en_hash(video_id: str) -> Optional[str]:
+    """
+    Return the hash of the EN payload the cached KO translation was made from, if any.
+    """
+    path = HASH_CACHE_DIR / f"{video_id}.en"
+    try:
+        return path.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+
+def save_en_hash(video_id: str, en_hash: str) -> None:
+    write_atomic(HASH_CACHE_DIR / f"{video_id}.en", f"{en_hash}\n".encode("utf-8"))
+
+
+def load_ko_cache(video_id: str, en_hash: str, provider: str) -> Optional[List[dict]]:
+    """
+    Return cached KO segments only if `provider` translated them from the EN payload hashing
+    to en_hash.
+
+    A KO cache made from a different EN payload is stale and is dropped. YouTube caches raw
+    translated snippets; batch MT providers cache the translated EN sentences.
+    """
+    if load_en_hash(video_id) != en_hash:
+        (RAW_CACHE_DIR / f"{video_id}.ko.json").unlink(missing_ok=True)
+        (HASH_CACHE_DIR / f"{video_id}.en").unlink(missing_ok=True)
+        return None
+    return load_raw_cache(video_id, "ko", provider)
+
+
+def save_ko_cache(video_id: str, segments: List[dict], en_hash: str, provider: str) -> None:
+    # KO first, hash second: a crash in between leaves a mismatching hash, never a stale match.
+    save_raw_cache(video_id, segments, "ko", provider)
+    save_en_hash(video_id, en_hash)
+
+
+def ko_from_cache(
+    ko_segments: List[dict], en_sentences: List[dict], provider: str
+) -> Optional[List[dict]]:
+    if provider == "youtube":
+        return merge_segments_to_sentences(to_snippets(ko_segments))
+    # MT output is one KO sentence per EN sentence; re-apply the current EN timings.
+    if len(ko_segments) != len(en_sentences):
+        return None
+    return [{**en, "text": ko["text"]} for en, ko in zip(en_sentences, ko_segments)]
+
+
+def fetch_transcripts_en_ko(
+    video_id: str, force: bool = False, provider: str = "youtube"
+) -> Optional[dict]:
     """
     영어(en) 기준으로 가져오고 ko 번역도 생성.
+
+    Raw segments are cached under .cache/raw so later runs can re-merge without the network;
+    pass force=True to ignore the EN cache. Cached KO is only reused when `provider` made it from
+    an EN payload that hashes the same (returned as "en_hash"). For batch MT providers, KO is
+    left to the caller on a cache miss.
     """
+    if not force:
+        en_raw = load_raw_cache(video_id, "en")
+        if en_raw is not None:
+            en_hash = hash_segments(en_raw)
+            ko_raw = load_ko_cache(video_id, en_hash, provider)
+            if ko_raw is not None or provider != "youtube":
+                en_sentences = merge_segments_to_sentences(to_snippets(en_raw))
+                return {
+                    "en": en_sentences,
+                    "ko": (
+                        ko_from_cache(ko_raw, en_sentences, provider)
+                        if ko_raw is not None
+                        else None
+                    ),
+                    "en_hash": en_hash,
+                }
+
     try:
-        fetched_en = ytt_api.fetch(video_id, languages=["en", "en-US", "en-GB"])
+        transcript_en = ytt_api.list(video_id).find_transcript(EN_LANGUAGES)
+        fetched_en = transcript_en.fetch()
     except (TranscriptsDisabled, NoTranscriptFound, VideoUnavailable):
         print(f"[skip] transcript unavailable (no EN) for {video_id}")
         return None
@@ -202,44 +495,293 @@ def fetch_transcripts_en_ko(video_id: str) -> Optional[Dict[str, Optional[List[d
         print(f"[error] failed to fetch EN transcript for {video_id}: {exc}")
         return None
 
-    en_sentences = merge_segments_to_sentences(fetched_en.to_raw_data())
+    en_raw = fetched_en.to_raw_data()
+    en_hash = hash_segments(en_raw)
+    save_raw_cache(video_id, en_raw, "en")
+    en_sentences = merge_segments_to_sentences(fetched_en)
 
     ko_sentences: Optional[List[dict]] = None
+    ko_raw = load_ko_cache(video_id, en_hash, provider)
+    if ko_raw is not None:
+        ko_sentences = ko_from_cache(ko_raw, en_sentences, provider)
+    elif provider == "youtube":
+        try:
+            fetched_ko = transcript_en.translate("ko").fetch()
+            save_ko_cache(video_id, fetched_ko.to_raw_data(), en_hash, provider)
+            ko_sentences = merge_segments_to_sentences(fetched_ko)
+        except Exception as exc:
+            print(f"[warn] could not translate {video_id} → ko: {exc}")
+
+    return {"en": en_sentences, "ko": ko_sentences, "en_hash": en_hash}
+
+
+def translate_batch(texts: List[str], provider: str, api_key: str) -> List[str]:
+    """
+    Translate up to MT_BATCH_SIZE EN texts to KO in a single MT API request.
+    """
+    if provider == "deepl":
+        url = DEEPL_FREE_API_URL if api_key.endswith(":fx") else DEEPL_API_URL
+        resp = _SESSION.post(
+            url,
+            headers={"Authorization": f"DeepL-Auth-Key {api_key}"},
+            data={"text": texts, "source_lang": "EN", "target_lang": "KO"},
+            timeout=30,
+        )
+        resp.raise_for_status()
+        return [item["text"] for item in resp.json()["translations"]]
+    if provider == "google":
+        # Key goes in a header, not the URL, so it never shows up in logged HTTP errors.
+        resp = _SESSION.post(
+            GOOGLE_TRANSLATE_URL,
+            headers={"X-goog-api-key": api_key},
+            data={"q": texts, "source": "en", "target": "ko", "format": "text"},
+            timeout=30,
+        )
+        resp.raise_for_status()
+        return [item["translatedText"] for item in resp.json()["data"]["translations"]]
+    raise ValueError(f"unsupported MT provider: {provider}")
+
+
+def translate_sentences_ko(
+    en_by_video: Dict[str, List[dict]], provider: str, api_key: str
+) -> Iterator[Tuple[str, List[dict]]]:
+    """
+    Batch-translate EN sentences of many videos; KO sentences reuse the EN timings.
+
+    Sentences from all videos are packed into requests of up to MT_BATCH_SIZE texts, sent
+    MAX_WORKERS at a time. A video is yielded as (video_id, ko_sentences) as soon as all of its
+    requests complete, so a failed request only loses the videos it carried. Videos that are
+    never yielded were not translated.
+    """
+    batches: List[List[Tuple[str, int]]] = []  # (video_id, sentence index) per text
+    batch: List[Tuple[str, int]] = []
+    pending_batches: Dict[str, int] = {}
+    for video_id, sentences in en_by_video.items():
+        for idx in range(len(sentences)):
+            if not batch or batch[-1][0] != video_id:
+                pending_batches[video_id] = pending_batches.get(video_id, 0) + 1
+            batch.append((video_id, idx))
+            if len(batch) == MT_BATCH_SIZE:
+                batches.append(batch)
+                batch = []
+    if batch:
+        batches.append(batch)
+
+    translated: Dict[str, List[str]] = {
+        video_id: [""] * len(sentences) for video_id, sentences in en_by_video.items()
+    }
+    failed: Set[str] = set()
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(
+                translate_batch,
+                [en_by_video[video_id][idx]["text"] for video_id, idx in batch],
+                provider,
+                api_key,
+            ): batch
+            for batch in batches
+        }
+        for future in as_completed(futures):
+            batch = futures[future]
+            batch_videos = list(dict.fromkeys(video_id for video_id, _ in batch))
+            try:
+                texts = future.result()
+                if len(texts) != len(batch):
+                    raise ValueError(f"got {len(texts)} translations for {len(batch)} texts")
+            except Exception as exc:
+                print(
+                    f"[warn] {provider} translation → ko failed for "
+                    f"{', '.join(batch_videos)}: {exc}"
+                )
+                failed.update(batch_videos)
+            else:
+                for (video_id, idx), text in zip(batch, texts):
+                    translated[video_id][idx] = text
+
+            for video_id in batch_videos:
+                pending_batches[video_id] -= 1
+                if pending_batches[video_id] == 0 and video_id not in failed:
+                    yield video_id, [
+                        {**sentence, "text": text}
+                        for sentence, text in zip(en_by_video[video_id], translated[video_id])
+                    ]
+
+
+def translate_youtube_ko(video_id: str) -> Optional[List[dict]]:
+    """
+    YouTube auto-translate fallback for videos the batch MT provider could not translate.
+
+    Not cached, and main records the published KO as YouTube's, so is_up_to_date reports the
+    video as stale and the next run retries the configured provider.
+    """
     try:
-        fetched_ko = fetched_en.translate("ko")
-        ko_sentences = merge_segments_to_sentences(fetched_ko.to_raw_data())
+        transcript_en = ytt_api.list(video_id).find_transcript(EN_LANGUAGES)
+        return merge_segments_to_sentences(transcript_en.translate("ko").fetch())
     except Exception as exc:
         print(f"[warn] could not translate {video_id} → ko: {exc}")
+        return None
 
-    return {"en": en_sentences, "ko": ko_sentences}
+
+def load_index() -> List[dict]:
+    if not INDEX_PATH.exists():
+        return []
+    try:
+        data = load_json(INDEX_PATH)
+    except (OSError, ValueError) as exc:
+        print(f"[warn] ignoring unreadable index.json: {exc}")
+        return []
+    return data if isinstance(data, list) else []
 
 
 def save_index(entries: List[dict]) -> None:
-    with INDEX_PATH.open("w", encoding="utf-8") as f:
-        json.dump(entries, f, ensure_ascii=False, indent=2)
-        f.write("\n")
+    write_atomic(INDEX_PATH, dump_json(entries))
 
 
 def save_transcript(video_id: str, transcript: List[dict], lang: str) -> Path:
-    lang_dir = TRANSCRIPTS_DIR / lang
-    lang_dir.mkdir(parents=True, exist_ok=True)
-    path = lang_dir / f"{video_id}.json"
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(transcript, f, ensure_ascii=False, indent=2)
-        f.write("\n")
+    path = TRANSCRIPTS_DIR / lang / f"{video_id}.json"
+    write_atomic(path, dump_json(transcript))
     return path
 
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help=(
+            "refetch every transcript, ignoring existing output and the raw cache "
+            "(KO is still reused when the EN transcript is unchanged)"
+        ),
+    )
+    return parser.parse_args()
+
+
+def load_ko_provider(video_id: str) -> Optional[str]:
+    """
+    Return which provider made the published KO transcript, if recorded.
+    """
+    try:
+        return (PROVIDER_CACHE_DIR / f"{video_id}.ko").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+
+def save_ko_provider(video_id: str, provider: str) -> None:
+    write_atomic(PROVIDER_CACHE_DIR / f"{video_id}.ko", f"{provider}\n".encode("utf-8"))
+
+
+def is_up_to_date(video_id: str, entry: Optional[dict], provider: str) -> bool:
+    """
+    True when the video is already indexed and both EN and KO output files exist.
+
+    KO published by a different provider (e.g. a YouTube fallback under MT_PROVIDER=deepl) is
+    not up to date, so the configured provider is retried. Output with no provider record
+    (written before it was tracked, or after .cache was wiped) counts as up to date.
+    """
+    if not entry:
+        return False
+    urls = entry.get("transcriptUrls", {})
+    if not all(
+        lang in urls and (TRANSCRIPTS_DIR / lang / f"{video_id}.json").exists()
+        for lang in ("en", "ko")
+    ):
+        return False
+    return load_ko_provider(video_id) in (None, provider)
+
+
 def main() -> None:
+    args = parse_args()
     config = load_env()
-    video_ids = fetch_playlist_video_ids(config["api_key"], config["playlist_id"])
-    print(f"[info] playlist items: {len(video_ids)}")
+    existing_index = load_index()
+    existing_entries = {
+        entry["videoId"]: entry
+        for entry in existing_index
+        if isinstance(entry, dict) and entry.get("videoId")
+    }
+
+    # Fetching is network-bound, so run it in a thread pool; writes stay on the main thread.
+    # Videos are submitted as each playlist page arrives, overlapping pagination with fetching.
+    video_ids: List[str] = []
+    seen: Set[str] = set()
+    skipped: Set[str] = set()
+    results: Dict[str, dict] = {}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {}
+        for video_id in iter_playlist_video_ids(config["api_key"], config["playlist_id"]):
+            if video_id in seen:
+                continue  # duplicate playlist item
+            seen.add(video_id)
+            video_ids.append(video_id)
+            if not args.force and is_up_to_date(
+                video_id, existing_entries.get(video_id), config["mt_provider"]
+            ):
+                skipped.add(video_id)
+                continue
+            future = executor.submit(
+                fetch_transcripts_en_ko, video_id, args.force, config["mt_provider"]
+            )
+            futures[future] = video_id
+        print(f"[info] playlist items: {len(video_ids)} ({len(skipped)} up to date)")
+
+        for future in as_completed(futures):
+            video_id = futures[future]
+            try:
+                transcripts = future.result()
+            except Exception as exc:
+                # Treat any other worker error as a failed fetch rather than aborting the run.
+                print(f"[error] failed to process {video_id}: {exc}")
+                continue
+            if transcripts:
+                results[video_id] = transcripts
+
+    if config["mt_provider"] != "youtube":
+        pending = {
+            video_id: transcripts["en"]
+            for video_id, transcripts in results.items()
+            if transcripts.get("en") and not transcripts.get("ko")
+        }
+        if pending:
+            print(f"[info] translating {len(pending)} videos → ko via {config['mt_provider']}")
+            for video_id, ko_sentences in translate_sentences_ko(
+                pending, config["mt_provider"], config["mt_api_key"]
+            ):
+                results[video_id]["ko"] = ko_sentences
+                save_ko_cache(
+                    video_id,
+                    ko_sentences,
+                    results[video_id]["en_hash"],
+                    config["mt_provider"],
+                )
 
-    index_entries: List[dict] = []
+            failed = [video_id for video_id in pending if not results[video_id].get("ko")]
+            if failed:
+                print(f"[info] falling back to YouTube translation for {len(failed)} videos")
+                with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                    for video_id, ko_sentences in zip(
+                        failed, executor.map(translate_youtube_ko, failed)
+                    ):
+                        if ko_sentences:
+                            results[video_id]["ko"] = ko_sentences
+                            results[video_id]["ko_provider"] = "youtube"
+
+    entries_by_id: Dict[str, dict] = {}
 
     for video_id in video_ids:
-        transcripts = fetch_transcripts_en_ko(video_id)
+        if video_id in skipped:
+            entries_by_id[video_id] = {
+                "videoId": video_id,
+                "transcriptUrls": {
+                    lang: f"{config['base_url']}/transcripts/{lang}/{video_id}.json"
+                    for lang in ("en", "ko")
+                },
+            }
+            continue
+
+        transcripts = results.get(video_id)
         if not transcripts:
+            # Fetch failed (e.g. a transient error or 429): keep the entry from the last run.
+            if video_id in existing_entries:
+                entries_by_id[video_id] = existing_entries[video_id]
             continue
 
         urls: Dict[str, str] = {}
@@ -250,7 +792,12 @@ def main() -> None:
 
         if transcripts.get("ko"):
             save_transcript(video_id, transcripts["ko"], "ko")
+            save_ko_provider(video_id, transcripts.get("ko_provider", config["mt_provider"]))
             urls["ko"] = f"{config['base_url']}/transcripts/ko/{video_id}.json"
+        elif transcripts.get("en"):
+            # No KO matches this EN any more; don't leave an old translation published beside it.
+            (TRANSCRIPTS_DIR / "ko" / f"{video_id}.json").unlink(missing_ok=True)
+            (PROVIDER_CACHE_DIR / f"{video_id}.ko").unlink(missing_ok=True)
 
         if not urls:
             continue
@@ -259,11 +806,16 @@ def main() -> None:
             "videoId": video_id,
             "transcriptUrls": urls,
         }
-        index_entries.append(entry)
+        entries_by_id[video_id] = entry
 
         print(f"[ok] saved transcript for {video_id}: {', '.join(urls.keys())}")
 
-    save_index(index_entries)
+    # Stable videoId order keeps index.json diffs limited to entries that actually changed.
+    index_entries = [entries_by_id[video_id] for video_id in sorted(entries_by_id)]
+    if index_entries == existing_index:
+        print("[info] index.json unchanged")
+    else:
+        save_index(index_entries)
     print("업데이트 완료")
 
 